@@ -0,0 +1,28 @@
+# interest_kernel.py
+"""Batch interest arithmetic, kept free of Flask/pattern machinery.
+
+Balances are integer cents and rates are integer percents, so the kernel
+is pure integer multiply/floor-divide with no float rounding. It is a
+plain index loop so numba's @njit can compile it. numba is optional: when
+it isn't installed the loop runs as ordinary CPython, which is plenty for
+a handful of in-memory accounts.
+
+Callers must not pass empty sequences (numba cannot infer a type for an
+empty plain list), and under numba the plain-list arguments compile as
+"reflected lists", which numba has pending-deprecated; switch the call
+site to numpy arrays or numba.typed.List if that removal ever lands.
+"""
+
+try:
+    from numba import njit
+except ImportError: # numba is an optional accelerator, not a requirement
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+@njit(cache=True)
+def batch_interest_kernel(balances_cents, rate_percents, out):
+    """Fills out[i] with the interest in cents for every i."""
+    for i in range(len(balances_cents)):
+        out[i] = balances_cents[i] * rate_percents[i] // 100